@@ -49,10 +49,16 @@ for further processing and integration with other data sources like the EIA 860
 and EIA 923.
 
 """
+import collections
+import concurrent.futures
+import functools
+import itertools
 import logging
+import mmap
+import multiprocessing
 import os.path
 import re
-import string
+import struct
 
 import dbfread
 import pandas as pd
@@ -64,6 +70,20 @@ import pudl.workspace.datastore as datastore
 
 logger = logging.getLogger(__name__)
 
+# Matches numeric DBF values which need no cleaning beyond the removal of
+# surrounding whitespace: no padding characters, no leading zeroes which would
+# be stripped from an integer, and no bare periods.
+CLEAN_NUMERIC_RE = re.compile(
+    rb'\s*(-?(?:[1-9][0-9]*(?:\.[0-9]*)?|[0-9]*\.[0-9]+))\s*')
+
+# Each DBF file starts with a 32 byte header, followed by one 32 byte
+# descriptor for each field, which we unpack into the field's name, type,
+# length, and decimal count. The descriptors are terminated by a carriage
+# return.
+DBF_HEADER_SIZE = 32
+DBF_FIELD_STRUCT = struct.Struct('<11sc4xBB14x')
+DBFField = collections.namedtuple('DBFField', ['name', 'type', 'length'])
+
 
 def drop_tables(engine):
     """Drop all FERC Form 1 tables from the SQLite database.
@@ -122,14 +142,15 @@ def add_sqlite_table(table_name, sqlite_meta, dbc_map, data_dir,
     """
     # Create the new table object
     new_table = sa.Table(table_name, sqlite_meta)
-    ferc1_dbf = dbfread.DBF(
+    dbf_fields = get_dbf_fields(
         get_dbf_path(table_name, refyear, data_dir=data_dir))
 
     # Add Columns to the table
-    for field in ferc1_dbf.fields:
+    col_rename = dbc_map[table_name]
+    for field in dbf_fields:
         if field.name == '_NullFlags':
             continue
-        col_name = dbc_map[table_name][field.name]
+        col_name = col_rename[field.name]
         if (table_name, col_name) in bad_cols:
             continue
         col_type = pc.dbf_typemap[field.type]
@@ -155,6 +176,26 @@ def add_sqlite_table(table_name, sqlite_meta, dbc_map, data_dir,
         )
 
 
+@functools.lru_cache(maxsize=None)
+def get_ferc1_dir(year, data_dir):
+    """Given a year, returns the path to its FERC Form 1 datastore directory.
+
+    The same handful of year directories are looked up for every table, so
+    the results are cached.
+
+    Args:
+        year (int): The year that we're trying to read data for.
+        data_dir (str): A string representing the full path to the top level of
+            the PUDL datastore containing the FERC Form 1 data to be used.
+
+    Returns:
+        str: the path to the directory containing the FERC Form 1 DBC and DBF
+        files for the year.
+
+    """
+    return datastore.path('ferc1', data_dir=data_dir, year=year, file=False)
+
+
 def dbc_filename(year, data_dir):
     """Given a year, returns the path to the master FERC Form 1 .DBC file.
 
@@ -165,9 +206,7 @@ def dbc_filename(year, data_dir):
         str: the file path to the master FERC Form 1 .DBC file for the year
 
     """
-    ferc1_path = datastore.path('ferc1', data_dir=data_dir,
-                                year=year, file=False)
-    return os.path.join(ferc1_path, 'F1_PUB.DBC')
+    return os.path.join(get_ferc1_dir(year, data_dir), 'F1_PUB.DBC')
 
 
 def get_strings(filename, min_length=4):
@@ -190,17 +229,13 @@ def get_strings(filename, min_length=4):
         binary file.
 
     """
-    with open(filename, errors="ignore") as f:
-        result = ""
-        for c in f.read():
-            if c in string.printable:
-                result += c
-                continue
-            if len(result) >= min_length:
-                yield result
-            result = ""
-        if len(result) >= min_length:  # catch result at EOF
-            yield result
+    # Runs of printable ASCII characters (string.printable), scanned directly
+    # in the memory mapped binary contents of the file.
+    printable_re = re.compile(rb'[\x20-\x7e\t\n\r\x0b\x0c]{%d,}' % min_length)
+    with open(filename, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for match in printable_re.finditer(data):
+            yield match.group(0).decode('ascii')
 
 
 def get_dbc_map(year, data_dir, min_length=4):
@@ -232,55 +267,38 @@ def get_dbc_map(year, data_dir, min_length=4):
         (<=10 character) long name of that field as found in the DBF file.
 
     """
-    # Extract all the strings longer than "min" from the DBC file
-    dbc_strings = list(
-        get_strings(dbc_filename(year, data_dir), min_length=min_length)
-    )
-
-    # Get rid of leading & trailing whitespace in the strings:
-    dbc_strings = [s.strip() for s in dbc_strings]
-
-    # Get rid of all the empty strings:
-    dbc_strings = [s for s in dbc_strings if s != '']
-
-    # Collapse all whitespace to a single space:
-    dbc_strings = [re.sub(r'\s+', ' ', s) for s in dbc_strings]
-
-    # Pull out only strings that begin with Table or Field
-    dbc_strings = [s for s in dbc_strings if re.match('(^Table|^Field)', s)]
-
-    # Split strings by whitespace, and retain only the first two elements.
-    # This eliminates some weird dangling junk characters
-    dbc_strings = [' '.join(s.split()[:2]) for s in dbc_strings]
-
-    # Remove all of the leading Field keywords
-    dbc_strings = [re.sub('Field ', '', s) for s in dbc_strings]
-
-    # Join all the strings together (separated by spaces) and then split the
-    # big string on Table, so each string is now a table name followed by the
-    # associated field names, separated by spaces
-    dbc_table_strings = ' '.join(dbc_strings).split('Table ')
-
-    # strip leading & trailing whitespace from the lists
-    # and get rid of empty strings:
-    dbc_table_strings = [s.strip() for s in dbc_table_strings if s != '']
-
-    # Create a dictionary using the first element of these strings (the table
-    # name) as the key, and the list of field names as the values, and return
-    # it:
+    # Make a single pass over all the strings longer than "min" in the DBC
+    # file, keeping only those which begin with the Table or Field keywords,
+    # followed by a name. Anything after the name is dangling junk. Each table
+    # name becomes a key in the dictionary, and the field names which follow
+    # it are collected in a list as its value.
     tf_dict = {}
-    for table_string in dbc_table_strings:
-        table_and_fields = table_string.split()
-        tf_dict[table_and_fields[0]] = table_and_fields[1:]
+    fields = []
+    for dbc_string in get_strings(dbc_filename(year, data_dir),
+                                  min_length=min_length):
+        words = dbc_string.split(maxsplit=2)
+        if len(words) < 2 or words[0] not in ('Table', 'Field'):
+            continue
+        keyword, name = words[:2]
+        if keyword == 'Table':
+            fields = tf_dict[name] = []
+        else:
+            fields.append(name)
+
+    # List the year's files once, rather than checking for each table's DBF
+    # file separately. The names are compared regardless of case, as the
+    # filesystems on macOS and Windows do.
+    with os.scandir(get_ferc1_dir(year, data_dir)) as entries:
+        dbf_files = {entry.name.upper() for entry in entries
+                     if entry.is_file()}
 
     dbc_map = {}
     for table in pc.ferc1_tbl2dbf:
         dbf_path = get_dbf_path(table, year, data_dir=data_dir)
-        if os.path.isfile(dbf_path):
-            dbf_fields = dbfread.DBF(dbf_path).field_names
-            dbf_fields = [f for f in dbf_fields if f != '_NullFlags']
-            dbc_map[table] = \
-                {k: v for k, v in zip(dbf_fields, tf_dict[table])}
+        if os.path.basename(dbf_path).upper() in dbf_files:
+            dbf_fields = [f.name for f in get_dbf_fields(dbf_path)
+                          if f.name != '_NullFlags']
+            dbc_map[table] = dict(zip(dbf_fields, tf_dict[table]))
             if len(tf_dict[table]) != len(dbf_fields):
                 raise ValueError(
                     f"Number of DBF fields in {table} does not match what was "
@@ -289,7 +307,7 @@ def get_dbc_map(year, data_dir, min_length=4):
 
     # Insofar as we are able, make sure that the fields match each other
     for k in dbc_map:
-        for sn, ln in zip(dbc_map[k].keys(), dbc_map[k].values()):
+        for sn, ln in dbc_map[k].items():
             if ln[:8] != sn.lower()[:8]:
                 raise ValueError(
                     f"DBF field name mismatch: {ln[:8]} != {sn.lower()[:8]}"
@@ -339,7 +357,23 @@ def define_sqlite_db(sqlite_meta, dbc_map, data_dir,
                          bad_cols=bad_cols,
                          data_dir=data_dir)
 
-    sqlite_meta.create_all()
+    # Issue all of the CREATE TABLE statements inside a single transaction
+    # rather than committing each one separately. The sqlite3 module never
+    # starts a transaction for DDL statements on its own, so it has to be
+    # begun explicitly.
+    raw_conn = sqlite_meta.bind.raw_connection()
+    try:
+        cursor = raw_conn.cursor()
+        cursor.execute("BEGIN")
+        for table in sqlite_meta.sorted_tables:
+            cursor.execute(str(
+                sa.schema.CreateTable(table).compile(sqlite_meta.bind)))
+        raw_conn.commit()
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        raw_conn.close()
 
 
 def get_dbf_path(table, year, data_dir):
@@ -358,12 +392,47 @@ def get_dbf_path(table, year, data_dir):
         table name.
     """
     dbf_name = pc.ferc1_tbl2dbf[table]
-    ferc1_dir = datastore.path(
-        'ferc1', year=year, file=False, data_dir=data_dir)
-    dbf_path = os.path.join(ferc1_dir, f"{dbf_name}.DBF")
+    dbf_path = os.path.join(get_ferc1_dir(year, data_dir), f"{dbf_name}.DBF")
     return dbf_path
 
 
+def get_dbf_fields(dbf_path):
+    """Read the names, types, and lengths of the fields in a DBF file.
+
+    Only the header of the DBF file is read, which is all we need in order to
+    map its columns and define the corresponding SQLite table. This is much
+    cheaper than setting up a :class:`dbfread.DBF` object for the whole file.
+
+    Args:
+        dbf_path (str): The path to the DBF file to be read.
+
+    Returns:
+        list: A list of DBFField named tuples, with the name, type (a single
+        character) and length of each field in the DBF file, in order.
+
+    """
+    fields = []
+    with open(dbf_path, 'rb') as f:
+        f.seek(DBF_HEADER_SIZE)
+        while True:
+            descriptor = f.read(DBF_FIELD_STRUCT.size)
+            if descriptor[:1] in (b'\r', b'\n', b''):
+                break
+            name, field_type, length, decimal_count = \
+                DBF_FIELD_STRUCT.unpack(descriptor)
+            field_type = field_type.decode('latin1')
+            # Character fields longer than 255 bytes store the high byte of
+            # their length in the decimal count.
+            if field_type == 'C':
+                length |= decimal_count << 8
+            fields.append(DBFField(
+                name=name.split(b'\0')[0].decode('ascii'),
+                type=field_type,
+                length=length,
+            ))
+    return fields
+
+
 class FERC1FieldParser(dbfread.FieldParser):
     """A custom DBF parser to deal with bad FERC Form 1 data types."""
 
@@ -377,7 +446,9 @@ class FERC1FieldParser(dbfread.FieldParser):
 
         Accordingly, this custom parser strips leading and trailing zeros and
         null characters, and replaces a bare '.' character with zero, allowing
-        all these fields to be cast to numeric values.
+        all these fields to be cast to numeric values. The vast majority of
+        values are well formed, and are converted directly after a single
+        regular expression match.
 
         Args:
             self ():
@@ -385,6 +456,10 @@ class FERC1FieldParser(dbfread.FieldParser):
             data ():
 
         """
+        match = CLEAN_NUMERIC_RE.fullmatch(data)
+        if match:
+            number = match.group(1)
+            return float(number) if b'.' in number else int(number)
         # Strip whitespace, null characters, and zeroes
         data = data.strip().strip(b'*\x00').lstrip(b'0')
         # Replace bare periods (which are non-numeric) with zero.
@@ -393,7 +468,80 @@ class FERC1FieldParser(dbfread.FieldParser):
         return super(FERC1FieldParser, self).parseN(field, data)
 
 
-def get_raw_df(table, dbc_map, data_dir, years=pc.data_years['ferc1']):
+def open_dbf_memofile(dbf):
+    """Open the memo file belonging to a DBF table.
+
+    :mod:`dbfread` opens memo files internally, and has no public interface
+    for doing so, so its private memo module is only used here.
+
+    Args:
+        dbf (:class:`dbfread.DBF`): The DBF table whose memo file is opened.
+
+    Returns:
+        A memo file object, to be used as a context manager and passed to the
+        table's field parser. If the table has no memo file, a stand-in which
+        contains no memos is returned.
+
+    """
+    if dbf.memofilename:
+        return dbfread.memo.open_memofile(
+            dbf.memofilename, dbf.header.dbversion)
+    return dbfread.memo.FakeMemoFile(dbf.memofilename)
+
+
+def read_dbf_columns(dbf, field_names):
+    """Read the values of the given fields from every record in a DBF file.
+
+    Rather than iterating over the file one record at a time, as
+    :mod:`dbfread` does, the file is memory mapped and the values of each
+    field are sliced out of it and parsed a column at a time. Only the
+    requested fields are parsed. As with :mod:`dbfread`, deleted records are
+    skipped.
+
+    Args:
+        dbf (:class:`dbfread.DBF`): The DBF table to read. Its field parser
+            class and encoding are used to parse the values.
+        field_names (list): The names of the fields to read.
+
+    Returns:
+        dict: A dictionary with the requested field names as its keys, and
+        lists of the parsed values of that field, one per record, as values.
+
+    """
+    # Each record starts with a 1 byte flag indicating whether it has been
+    # deleted, followed by the fixed width values of all its fields.
+    fields = {}
+    offset = 1
+    for field in dbf.fields:
+        fields[field.name] = (field, offset)
+        offset += field.length
+
+    memofile = open_dbf_memofile(dbf)
+    headerlen = dbf.header.headerlen
+    recordlen = dbf.header.recordlen
+    with memofile, open(dbf.filename, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        starts = []
+        for start in range(headerlen, len(buf) - recordlen + 1, recordlen):
+            flag = buf[start:start + 1]
+            if flag == b' ':
+                starts.append(start)
+            elif flag == b'\x1a':
+                # End of file marker
+                break
+
+        parse = dbf.parserclass(dbf, memofile).parse
+        columns = {}
+        for name in field_names:
+            field, offset = fields[name]
+            end = offset + field.length
+            columns[name] = [parse(field, buf[start + offset:start + end])
+                             for start in starts]
+    return columns
+
+
+def get_raw_df(table, dbc_map, data_dir, years=pc.data_years['ferc1'],
+               columns=None):
     """Combine several years of a given FERC Form 1 DBF table into a dataframe.
 
     Args:
@@ -406,37 +554,191 @@ def get_raw_df(table, dbc_map, data_dir, years=pc.data_years['ferc1']):
             the PUDL datastore containing the FERC Form 1 data to be used.
         min_length (int): The minimum number of consecutive printable
         years (list): Range of years to be combined into a single DataFrame.
+        columns (list): The full (DBC) names of the columns to read. If None
+            (the default) all of the table's columns are read. Otherwise, any
+            year whose table lacks some of these columns is skipped.
 
     Returns:
         :class:`pandas.DataFrame`: A DataFrame containing several years of FERC
         Form 1 data for the given table.
 
     """
-    dbf_name = pc.ferc1_tbl2dbf[table]
-
     raw_dfs = []
     for yr in years:
-        ferc1_dir = datastore.path(
-            'ferc1', year=yr, file=False, data_dir=data_dir)
-        dbf_path = os.path.join(ferc1_dir, f"{dbf_name}.DBF")
-
+        dbf_path = get_dbf_path(table, yr, data_dir=data_dir)
         if os.path.exists(dbf_path):
-            new_df = pd.DataFrame(
-                iter(dbfread.DBF(dbf_path,
-                                 encoding='latin1',
-                                 parserclass=FERC1FieldParser)))
-            raw_dfs = raw_dfs + [new_df, ]
+            # The DBF file is read column by column, rather than building a
+            # dict for every record and having pandas transpose them.
+            dbf = dbfread.DBF(dbf_path,
+                              encoding='latin1',
+                              parserclass=FERC1FieldParser)
+            dbf_fields = [f for f in dbf.field_names if f != '_NullFlags']
+            if columns is not None:
+                dbf_fields = [f for f in dbf_fields
+                              if dbc_map[table].get(f, f) in columns]
+                found = {dbc_map[table].get(f, f) for f in dbf_fields}
+                if not found.issuperset(columns):
+                    logger.debug(
+                        f"Skipping {table} for {yr}, which lacks some of the "
+                        f"requested columns.")
+                    continue
+            cols = read_dbf_columns(dbf, dbf_fields)
+            raw_dfs.append(
+                pd.DataFrame(cols, copy=False).rename(dbc_map[table], axis=1))
 
     if raw_dfs:
-        return (
-            pd.concat(raw_dfs, sort=True).
-            drop('_NullFlags', axis=1, errors='ignore').
-            rename(dbc_map[table], axis=1)
+        return pd.concat(raw_dfs, sort=False, copy=False)
+
+
+def get_raw_records(table, year, columns, field_map, data_dir,
+                    bad_cols=()):
+    """Read the records from one year of a FERC Form 1 DBF table.
+
+    Unlike :func:`get_raw_df` the records are returned as plain tuples, ready
+    to be inserted directly into the SQLite database. They are also cheap to
+    pass back from a worker process.
+
+    Args:
+        table (string): The name of the FERC Form 1 table from which data is
+            read.
+        year (int): The year of data to read.
+        columns (list): The full (DBC) names of the columns to be returned, in
+            the order in which they should appear in each record.
+        field_map (dict): The table's entry in the dictionary returned by
+            get_dbc_map(), mapping the truncated DBF field names to the full
+            (DBC) column names.
+        data_dir (str): A string representing the full path to the top level of
+            the PUDL datastore containing the FERC Form 1 data to be used.
+        bad_cols (iterable of 2-tuples): A list or other iterable containing
+            pairs of strings of the form (table_name, column_name), indicating
+            columns which are not cloned into the SQLite database, and so are
+            skipped.
+
+    Returns:
+        list: A list of tuples, each containing the values of ``columns`` for
+        one record. Columns which do not exist in the year's DBF file are
+        filled in with None. The list is empty if there is no DBF file for the
+        table in the given year.
+
+    Raises:
+        ValueError: If the year's DBF file contains a field which is not one of
+            the ``columns``, and isn't one of the ``bad_cols`` either, or if
+            none of its fields are among the ``columns``.
+
+    """
+    dbf_path = get_dbf_path(table, year, data_dir=data_dir)
+    if not os.path.exists(dbf_path):
+        return []
+    dbf = dbfread.DBF(dbf_path,
+                      encoding='latin1',
+                      parserclass=FERC1FieldParser)
+    dbf_names = {}
+    for name in dbf.field_names:
+        col = field_map.get(name, name)
+        if name == '_NullFlags' or (table, col) in bad_cols:
+            continue
+        if col not in columns:
+            raise ValueError(
+                f"Field {name} of the FERC Form 1 table {table} in {year} "
+                f"does not match any of the columns of {table} in the SQLite "
+                f"database."
+            )
+        dbf_names[col] = name
+    if not dbf_names:
+        raise ValueError(
+            f"None of the fields of the FERC Form 1 table {table} in {year} "
+            f"match the columns of {table} in the SQLite database."
         )
+    values = read_dbf_columns(
+        dbf, [dbf_names[col] for col in columns if col in dbf_names])
+    return list(zip(*[
+        values[dbf_names[col]] if col in dbf_names else itertools.repeat(None)
+        for col in columns
+    ]))
+
+
+def insert_raw_records(cursor, executor, sqlite_meta, tables, years, dbc_map,
+                       data_dir, max_pending, bad_cols=()):
+    """Parse FERC Form 1 DBF files in a pool of workers and insert the records.
+
+    The tables and years are submitted to the pool in the order in which they
+    will be inserted, running ahead of the inserts so that the workers keep
+    parsing in the meantime, including the next table's files. Only a limited
+    number of them are submitted ahead of time though, so that parsed records
+    can't pile up in memory waiting to be inserted. SQLite only allows a
+    single writer, so all the records are inserted here as they come back,
+    within one transaction per table.
+
+    Args:
+        cursor (:class:`sqlite3.Cursor`): A cursor on the raw connection to
+            the FERC Form 1 SQLite database, in autocommit mode.
+        executor (:class:`concurrent.futures.Executor`): The pool of workers
+            that the DBF files are parsed in.
+        sqlite_meta (:class:`sqlalchemy.schema.MetaData`): The schema of the
+            FERC Form 1 SQLite database.
+        tables (iterable): The tables to be loaded.
+        years (iterable): The years of data to be loaded.
+        dbc_map (dict of dicts): A dictionary of dictionaries, of the kind
+            returned by get_dbc_map(), describing the table and column names
+            stored within the FERC Form 1 FoxPro database files.
+        data_dir (str): A string representing the full path to the top level of
+            the PUDL datastore containing the FERC Form 1 data to be used.
+        max_pending (int): The maximum number of DBF files that may be parsed
+            or waiting to be inserted at any one time.
+        bad_cols (iterable of 2-tuples): A list or other iterable containing
+            pairs of strings of the form (table_name, column_name), indicating
+            columns which were not cloned into the SQLite database.
+
+    Returns:
+        dict: The number of records inserted into each table.
+
+    """
+    table_cols = {
+        table: [c.name for c in sqlite_meta.tables[table].c]
+        for table in tables
+    }
+    # The years are inserted from oldest to newest. Because it has no year in
+    # it, there would be multiple definitions of respondents in
+    # f1_respondent_id, but its records replace any existing ones with the
+    # same primary key, so the most recently reported definition of each
+    # respondent is retained.
+    years = sorted(years)
+    jobs = iter([(table, yr) for table in tables for yr in years])
+    pending = collections.deque()
+    n_recs = {}
+    try:
+        for table in tables:
+            cols = table_cols[table]
+            col_list = ", ".join(f'"{col}"' for col in cols)
+            placeholders = ", ".join(["?"] * len(cols))
+            insert = ("INSERT OR REPLACE" if table == 'f1_respondent_id'
+                      else "INSERT")
+            insert_sql = (f'{insert} INTO "{table}" ({col_list}) '
+                          f'VALUES ({placeholders})')
+            n_recs[table] = 0
+            cursor.execute("BEGIN IMMEDIATE")
+            for _ in years:
+                for job_table, job_yr in itertools.islice(
+                        jobs, max_pending - len(pending)):
+                    pending.append(executor.submit(
+                        get_raw_records, job_table, job_yr,
+                        table_cols[job_table], dbc_map[job_table],
+                        data_dir=data_dir, bad_cols=bad_cols))
+                records = pending.popleft().result()
+                cursor.executemany(insert_sql, records)
+                n_recs[table] += len(records)
+            cursor.execute("COMMIT")
+            logger.info(f"SQLite: loaded {n_recs[table]} rows into {table}.")
+    except BaseException:
+        # Don't leave the workers parsing files that will never be inserted.
+        for future in pending:
+            future.cancel()
+        raise
+    return n_recs
 
 
 def dbf2sqlite(tables, years, refyear, pudl_settings,
-               bad_cols=(), clobber=False):
+               bad_cols=(), clobber=False, max_workers=None):
     """Clone the FERC Form 1 Databsae to SQLite.
 
     Args:
@@ -449,6 +751,9 @@ def dbf2sqlite(tables, years, refyear, pudl_settings,
             indicating columns that should be skipped during the cloning
             process. Both table and column are strings in this case, the
             names of their respective entities within the database metadata.
+        clobber (bool): If True, replace an existing FERC Form 1 database.
+        max_workers (int or None): The number of worker processes used to
+            parse the DBF files. If None, use one per CPU.
 
     Returns:
         None
@@ -467,47 +772,68 @@ def dbf2sqlite(tables, years, refyear, pudl_settings,
     sqlite_engine = sa.create_engine(pudl_settings["ferc1_db"])
     sqlite_meta = sa.MetaData(bind=sqlite_engine)
 
-    # Get the mapping of filenames to table names and fields
-    logger.info(f"Creating a new database schema based on {refyear}.")
-    dbc_map = get_dbc_map(refyear, data_dir=pudl_settings['data_dir'])
-    define_sqlite_db(sqlite_meta, dbc_map, tables=tables,
-                     refyear=refyear, bad_cols=bad_cols,
-                     data_dir=pudl_settings['data_dir'])
-
-    for table in tables:
-        logger.info(f"Pandas: reading {table} into a DataFrame.")
-        new_df = get_raw_df(table, dbc_map, years=years,
-                            data_dir=pudl_settings['data_dir'])
-        # Because this table has no year in it, there would be multiple
-        # definitions of respondents if we didn't drop duplicates.
-        if table == 'f1_respondent_id':
-            new_df = new_df.drop_duplicates(
-                subset='respondent_id', keep='last')
-        n_recs = len(new_df)
-        logger.debug(f"    {table}: N = {n_recs}")
-        # Only try and load the table if there are some actual records:
-        if n_recs <= 0:
-            continue
+    # The records are inserted through the underlying sqlite3 connection, on
+    # which we manage the transactions ourselves. The clone is written once and
+    # then read a whole table at a time, so it uses large pages. The page size
+    # of an existing database can only be changed by rebuilding it, which is
+    # cheap now that it's empty.
+    raw_conn = sqlite_engine.raw_connection()
+    try:
+        raw_conn.connection.isolation_level = None
+        cursor = raw_conn.cursor()
+        cursor.executescript("PRAGMA page_size = 65536; VACUUM;")
+
+        # Get the mapping of filenames to table names and fields
+        logger.info(f"Creating a new database schema based on {refyear}.")
+        dbc_map = get_dbc_map(refyear, data_dir=pudl_settings['data_dir'])
+        define_sqlite_db(sqlite_meta, dbc_map, tables=tables,
+                         refyear=refyear, bad_cols=bad_cols,
+                         data_dir=pudl_settings['data_dir'])
+
+        # Bulk load the records through the underlying sqlite3 connection,
+        # with one executemany() per table inside a single transaction, rather
+        # than letting pandas.to_sql() issue the inserts through SQLAlchemy.
+        # The clone can always be regenerated, so we don't need a durable
+        # journal.
+        cursor.executescript(
+            "PRAGMA synchronous = OFF; "
+            "PRAGMA journal_mode = MEMORY; "
+            "PRAGMA temp_store = MEMORY; "
+            "PRAGMA cache_size = -262144; "
+            "PRAGMA foreign_keys = OFF;"
+        )
 
-        # Write the records out to the SQLite database, and make sure that
-        # the inferred data types are being enforced during loading.
-        # if_exists='append' is being used because we defined the tables
-        # above, but left them empty. Becaue the DB is reset at the beginning
-        # of the function, this shouldn't ever result in duplicate records.
-        coltypes = {col.name: col.type for col in sqlite_meta.tables[table].c}
-        logger.info(f"SQLite: loading {n_recs} rows into {table}.")
-        new_df.to_sql(table, sqlite_engine,
-                      if_exists='append', chunksize=100000,
-                      dtype=coltypes, index=False)
+        # Parsing the DBF files is CPU bound, and every table and year can be
+        # parsed independently, so it is farmed out to a pool of worker
+        # processes. The workers are only started once the first files are
+        # submitted, by which time we hold an open SQLite connection with a
+        # write transaction in progress. SQLite connections must not be
+        # carried across a fork(), so the workers are spawned as fresh
+        # processes instead.
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn')) as executor:
+            n_recs = insert_raw_records(
+                cursor, executor, sqlite_meta, tables, years, dbc_map,
+                data_dir=pudl_settings['data_dir'],
+                max_pending=2 * (max_workers or os.cpu_count() or 1),
+                bad_cols=bad_cols)
+    except Exception:
+        raw_conn.rollback()
+        raise
+    finally:
+        raw_conn.close()
+
+    # Only add missing respondents if some actual records were loaded:
+    if n_recs.get('f1_respondent_id', 0) > 0:
         # add the missing respondents into the respondent_id table.
-        if table == 'f1_respondent_id':
-            logger.debug(f'inserting missing respondents into {table}')
-            sa.insert(sqlite_meta.tables['f1_respondent_id'],
-                      # we can insert info info into any of the columns for this
-                      # table through the following dictionary, but each of the
-                      # records need to have all of the same columns (you can't
-                      # add a column for one respondent without adding it to all).
-                      values=[
+        logger.debug('inserting missing respondents into f1_respondent_id')
+        sa.insert(sqlite_meta.tables['f1_respondent_id'],
+                  # we can insert info info into any of the columns for this
+                  # table through the following dictionary, but each of the
+                  # records need to have all of the same columns (you can't
+                  # add a column for one respondent without adding it to all).
+                  values=[
                       {'respondent_id': 514,
                        'respondent_name': 'AEP, Texas (PUDL determined)'},
                       {'respondent_id': 515,
@@ -522,8 +848,9 @@ def dbf2sqlite(tables, years, refyear, pudl_settings,
                        'respondent_name': 'respondent_519'},
                       {'respondent_id': 522,
                        'respondent_name':
-                       'Luning Energy Holdings LLC, Invenergy Investments (PUDL determined)'},
-            ]).execute()
+                       'Luning Energy Holdings LLC, Invenergy Investments '
+                       '(PUDL determined)'},
+        ]).execute()
 
 
 ###########################################################################
@@ -558,6 +885,33 @@ def get_ferc1_meta(ferc1_engine):
     return ferc1_meta
 
 
+def read_ferc1_sql(select, ferc1_engine):
+    """Read the records selected from the FERC Form 1 DB into a DataFrame.
+
+    The SELECT statement is compiled with its parameters rendered inline, and
+    run directly on the underlying sqlite3 connection. The records are then
+    fetched as plain tuples, rather than being wrapped one at a time in
+    SQLAlchemy result rows, which is much faster for large tables.
+
+    Args:
+        select (:class:`sqlalchemy.sql.expression.Select`): The SELECT
+            statement to run against the FERC Form 1 DB.
+        ferc1_engine (:mod:`sqlalchemy.engine.Engine`): SQL Alchemy database
+            connection engine for the PUDL FERC 1 DB.
+
+    Returns:
+        :class:`pandas.DataFrame`: the selected records.
+
+    """
+    sql = str(select.compile(
+        ferc1_engine, compile_kwargs={"literal_binds": True}))
+    raw_conn = ferc1_engine.raw_connection()
+    try:
+        return pd.read_sql(sql, raw_conn.connection)
+    finally:
+        raw_conn.close()
+
+
 def extract(ferc1_tables=pc.pudl_tables['ferc1'],
             ferc1_years=pc.working_years['ferc1'],
             pudl_settings=None):
@@ -674,7 +1028,7 @@ def fuel(ferc1_meta, ferc1_table, ferc1_years):
         .where(f1_fuel.c.report_year.in_(ferc1_years))
     )
     # Use the above SELECT to pull those records into a DataFrame:
-    return pd.read_sql(f1_fuel_select, ferc1_meta.bind)
+    return read_ferc1_sql(f1_fuel_select, ferc1_meta.bind)
 
 
 def plants_steam(ferc1_meta, ferc1_table, ferc1_years):
@@ -704,7 +1058,7 @@ def plants_steam(ferc1_meta, ferc1_table, ferc1_years):
         .where(f1_steam.c.tot_capacity > 0.0)
     )
 
-    return pd.read_sql(f1_steam_select, ferc1_meta.bind)
+    return read_ferc1_sql(f1_steam_select, ferc1_meta.bind)
 
 
 def plants_small(ferc1_meta, ferc1_table, ferc1_years):
@@ -740,7 +1094,7 @@ def plants_small(ferc1_meta, ferc1_table, ferc1_years):
                    (f1_small.c.fuel_cost != 0)))
     )
 
-    return pd.read_sql(f1_small_select, ferc1_meta.bind)
+    return read_ferc1_sql(f1_small_select, ferc1_meta.bind)
 
 
 def plants_hydro(ferc1_meta, ferc1_table, ferc1_years):
@@ -766,7 +1120,7 @@ def plants_hydro(ferc1_meta, ferc1_table, ferc1_years):
         .where(f1_hydro.c.report_year.in_(ferc1_years))
     )
 
-    return pd.read_sql(f1_hydro_select, ferc1_meta.bind)
+    return read_ferc1_sql(f1_hydro_select, ferc1_meta.bind)
 
 
 def plants_pumped_storage(ferc1_meta, ferc1_table, ferc1_years):
@@ -794,7 +1148,7 @@ def plants_pumped_storage(ferc1_meta, ferc1_table, ferc1_years):
         .where(f1_pumped_storage.c.report_year.in_(ferc1_years))
     )
 
-    return pd.read_sql(f1_pumped_storage_select, ferc1_meta.bind)
+    return read_ferc1_sql(f1_pumped_storage_select, ferc1_meta.bind)
 
 
 def plant_in_service(ferc1_meta, ferc1_table, ferc1_years):
@@ -818,7 +1172,7 @@ def plant_in_service(ferc1_meta, ferc1_table, ferc1_years):
         .where(f1_plant_in_srvce.c.report_year.in_(ferc1_years))
     )
 
-    return pd.read_sql(f1_plant_in_srvce_select, ferc1_meta.bind)
+    return read_ferc1_sql(f1_plant_in_srvce_select, ferc1_meta.bind)
 
 
 def purchased_power(ferc1_meta, ferc1_table, ferc1_years):
@@ -842,7 +1196,7 @@ def purchased_power(ferc1_meta, ferc1_table, ferc1_years):
         .where(f1_purchased_pwr.c.report_year.in_(ferc1_years))
     )
 
-    return pd.read_sql(f1_purchased_pwr_select, ferc1_meta.bind)
+    return read_ferc1_sql(f1_purchased_pwr_select, ferc1_meta.bind)
 
 
 def accumulated_depreciation(ferc1_meta, ferc1_table, ferc1_years):
@@ -866,7 +1220,7 @@ def accumulated_depreciation(ferc1_meta, ferc1_table, ferc1_years):
         .where(f1_accumdepr_prvsn.c.report_year.in_(ferc1_years))
     )
 
-    return pd.read_sql(f1_accumdepr_prvsn_select, ferc1_meta.bind)
+    return read_ferc1_sql(f1_accumdepr_prvsn_select, ferc1_meta.bind)
 
 
 ###########################################################################
@@ -937,14 +1291,33 @@ def show_dupes(table, dbc_map, data_dir, years=pc.data_years['ferc1'],
             and spplmnt_num.
 
     Returns:
-        None
+        pandas.DataFrame: The primary keys (and report years) of all the
+        records whose keys are duplicated within a year, or None if the table
+        has no data or lacks any of the key columns.
 
     """
-    logger.info(f"{table}:")
-    for yr in years:
-        raw_df = get_raw_df(table, dbc_map, data_dir=data_dir, years=[yr, ])
-        if not set(pk).difference(set(raw_df.columns)):
-            n_dupes = len(raw_df) - len(raw_df.drop_duplicates(subset=pk))
+    # Collect the per-year counts and log them all in a single message.
+    lines = [f"{table}:"]
+    dupes_df = None
+    # Read all the years at once, and count the duplicates within each year.
+    # Only the key columns are needed to identify the duplicates.
+    key_cols = list(dict.fromkeys(list(pk) + ['report_year']))
+    key_df = get_raw_df(table, dbc_map, data_dir=data_dir, years=years,
+                        columns=key_cols)
+    if key_df is not None and set(key_cols).issubset(key_df.columns):
+        # Only the key columns were read, so there's no need to select them.
+        # Find every record that shares its key with another one in a single
+        # pass. Within each year, all but one of the records with a given key
+        # count as duplicates, which only requires looking at those records.
+        dupes_df = key_df[key_df.duplicated(keep=False)]
+        dupes_by_year = (
+            dupes_df.report_year.value_counts()
+            .sub(dupes_df.drop_duplicates().report_year.value_counts(),
+                 fill_value=0)
+            .sort_index()
+        )
+        for yr, n_dupes in dupes_by_year.items():
             if n_dupes > 0:
-                logger.info(f"    {yr}: {n_dupes}")
-    # return raw_df[raw_df.duplicated(subset=pk, keep=False)]
+                lines.append(f"    {yr}: {int(n_dupes)}")
+    logger.info("\n".join(lines))
+    return dupes_df
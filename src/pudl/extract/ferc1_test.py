@@ -0,0 +1,113 @@
+"""Unit tests for the DBF reading functions in pudl.extract.ferc1."""
+import struct
+import unittest.mock as mock
+
+import dbfread
+import pytest
+
+import pudl.extract.ferc1 as ferc1
+
+# (name, type, length, decimal count) of each field in the test DBF file.
+TEST_FIELDS = [
+    ('RESPONDENT', 'N', 5, 0),
+    ('PLANT_NAME', 'C', 12, 0),
+    ('FUEL_QUANT', 'N', 12, 2),
+    ('REPORT_DT', 'D', 8, 0),
+    ('IS_ACTIVE', 'L', 1, 0),
+    ('_NullFlags', '0', 1, 0),
+]
+
+# The raw bytes of each record, and whether it has been deleted.
+TEST_RECORDS = [
+    (False, [b'    1', b'Plant A     ', b'      12.50 ', b'20180101',
+             b'T', b'\x00']),
+    (True, [b'    2', b'Deleted     ', b'       1.00 ', b'20180102',
+            b'F', b'\x00']),
+    (False, [b'    3', b'Plant \xe9     ', b'  00100     ', b'        ',
+             b'?', b'\x00']),
+    (False, [b'   -4', b'            ', b'       -.5  ', b'20181231',
+             b'F', b'\x00']),
+]
+
+
+def write_dbf(path, fields, records):
+    """Write a minimal Visual FoxPro style DBF file."""
+    headerlen = 32 + 32 * len(fields) + 1
+    recordlen = 1 + sum(length for _, _, length, _ in fields)
+    header = struct.pack('<BBBBLHH20x', 0x30, 118, 1, 1, len(records),
+                         headerlen, recordlen)
+    descriptors = b''
+    address = 1
+    for name, field_type, length, decimal_count in fields:
+        descriptors += struct.pack(
+            '<11scLBB14x', name.encode('ascii'), field_type.encode('ascii'),
+            address, length, decimal_count)
+        address += length
+    for _, values in records:
+        assert [len(v) for v in values] == [f[2] for f in fields]
+    body = b''.join((b'*' if deleted else b' ') + b''.join(values)
+                    for deleted, values in records)
+    with open(path, 'wb') as f:
+        f.write(header + descriptors + b'\r' + body + b'\x1a')
+
+
+@pytest.fixture
+def dbf_path(tmp_path):
+    """Path to a DBF file containing the test fields and records."""
+    path = tmp_path / 'F1_TEST.DBF'
+    write_dbf(path, TEST_FIELDS, TEST_RECORDS)
+    return str(path)
+
+
+def test_get_dbf_fields(dbf_path):
+    """Read the same field definitions from the header as dbfread."""
+    dbf = dbfread.DBF(dbf_path, encoding='latin1')
+    expected = [(f.name, f.type, f.length) for f in dbf.fields]
+    assert [tuple(f) for f in ferc1.get_dbf_fields(dbf_path)] == expected
+
+
+@pytest.mark.parametrize("parserclass", [
+    dbfread.FieldParser,
+    ferc1.FERC1FieldParser,
+])
+def test_read_dbf_columns(dbf_path, parserclass):
+    """Read the same values from each column as dbfread does by record."""
+    dbf = dbfread.DBF(dbf_path, encoding='latin1', parserclass=parserclass)
+    records = list(dbf)
+    assert len(records) == 3
+    columns = ferc1.read_dbf_columns(dbf, dbf.field_names)
+    assert columns == {
+        name: [record[name] for record in records]
+        for name in dbf.field_names
+    }
+
+
+def test_read_dbf_columns_subset(dbf_path):
+    """Only read the requested columns."""
+    dbf = dbfread.DBF(dbf_path, encoding='latin1')
+    columns = ferc1.read_dbf_columns(dbf, ['PLANT_NAME', 'RESPONDENT'])
+    assert columns == {
+        'PLANT_NAME': ['Plant A', 'Plant \xe9', ''],
+        'RESPONDENT': [1, 3, -4],
+    }
+
+
+def strip_parse_n(data):
+    """Parse a numeric value by stripping it first, as parseN used to."""
+    data = data.strip().strip(b'*\x00').lstrip(b'0')
+    if data == b'.':
+        data = b'0'
+    return dbfread.FieldParser(mock.Mock()).parseN(None, data)
+
+
+@pytest.mark.parametrize("data", [
+    b'0', b'00012', b'.', b'-0.25', b'*12.5*', b'', b'     ', b'  .  ',
+    b'1234', b'   1234.00', b'  0.00', b'0.5', b'-.5', b'1.', b'-12',
+    b'-0', b'007', b'\x00\x0000100     ', b'12\x00\x00', b'**', b'*0*',
+])
+def test_parse_n(data):
+    """The FERC Form 1 numeric parser matches the old strip based one."""
+    expected = strip_parse_n(data)
+    parsed = ferc1.FERC1FieldParser(mock.Mock()).parseN(None, data)
+    assert type(parsed) is type(expected)
+    assert parsed == expected
@@ -2,11 +2,32 @@
 
 import logging
 
+import pytest
+
+import pudl.validate as pv
+
 logger = logging.getLogger(__name__)
 
 
 def test_gen_eia923(pudl_out_eia):
     """Sanity checks for EIA 923 Generation output."""
     logger.info("Reading EIA 923 Generation data...")
-    logger.info(
-        f"Successfully pulled {len(pudl_out_eia.gen_eia923())} records.")
+    gen_df = pudl_out_eia.gen_eia923()
+    logger.info(f"Successfully pulled {len(gen_df)} records.")
+    assert not gen_df.empty
+
+
+@pytest.mark.parametrize(
+    "col", [
+        "report_date",
+        "plant_id_eia",
+        "plant_id_pudl",
+        "utility_id_eia",
+        "generator_id",
+        "net_generation_mwh",
+    ]
+)
+def test_no_null_cols_gen_eia923(pudl_out_eia, col):
+    """Verify that key EIA 923 Generation columns are not entirely NULL."""
+    pv.no_null_cols(pudl_out_eia.gen_eia923(), cols=[col],
+                    df_name="gen_eia923")